@@ -4,6 +4,15 @@ import time
 
 import aiohttp
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 from ..earthquake.eew import EEW
 from ..utils import MISSING
 from .abc import EEWClient
@@ -31,7 +40,7 @@ class HTTPEEWClient(EEWClient):
     """
 
     __session: aiohttp.ClientSession = MISSING
-    __task: asyncio.Task = MISSING
+    __connector: aiohttp.TCPConnector = MISSING
     __event_loop: asyncio.AbstractEventLoop = MISSING
     _alerts: dict[str, EEW] = {}
     node_latencies: list[tuple[str, float]] = []
@@ -39,61 +48,93 @@ class HTTPEEWClient(EEWClient):
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self._URL = f"{self.BASE_URL}/eq/eew?type=cwa"
+        self._poll_interval_idle: float = 1
+        self._poll_interval_active: float = 0.25
+        self._poll_interval_max: float = 5
+        self._consecutive_errors: int = 0
+        # in-flight notification fanouts, keyed by alert id so the fanouts of
+        # one alert stay ordered (send -> update -> lift)
+        self._notify_tasks: dict[str, asyncio.Task] = {}
 
     def recreate_session(self):
+        """
+        Create the client session if it does not exist or has been closed.
+
+        The session keeps a pooled keep-alive connection to the API node so
+        each poll reuses the established TCP/TLS connection.
+        """
         if not self.__session or self.__session.closed:
-            self.__session = aiohttp.ClientSession()
+            self.__connector = aiohttp.TCPConnector(
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self.__session = aiohttp.ClientSession(
+                connector=self.__connector,
+                timeout=aiohttp.ClientTimeout(total=5, connect=2),
+            )
 
-    async def new_alert(self, data: dict):
-        eew = EEW.from_dict(data)
-        self._alerts[eew.id] = eew
+    async def aclose(self):
+        """
+        Close the client session and its connector, and let the notification
+        clients release their own sessions.
+        """
+        if self.__session and not self.__session.closed:
+            await self.__session.close()
+        for client in self._notification_client:
+            aclose = getattr(client, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                self.logger.exception(
+                    f"Failed to close notification client: {client.__class__.__name__}", exc_info=e
+                )
 
-        self.logger.info(
-            "New EEW alert is detected!\n"
+    @staticmethod
+    def _format_alert_log(eew: EEW, updated: bool = False) -> str:
+        return (
+            ("EEW alert updated" if updated else "New EEW alert is detected!") + "\n"
             "--------------------------------\n"
             f"       ID: {eew.id} (Serial {eew.serial})\n"
-            f" Location: {eew.earthquake.location.display_name}({eew.earthquake.lon}, {eew.earthquake.lat})\n"
+            f" Location: {eew.earthquake.location.display_name}({eew.earthquake.lon:.2f}, {eew.earthquake.lat:.2f})\n"
             f"Magnitude: {eew.earthquake.mag}\n"
             f"    Depth: {eew.earthquake.depth}km\n"
             f"     Time: {eew.earthquake.time.strftime('%Y/%m/%d %H:%M:%S')}\n"
             "--------------------------------"
         )
 
-        eew.earthquake.calc_all_data_in_executor(self.__event_loop)
+    async def new_alert(self, data: dict):
+        eew = await self.__event_loop.run_in_executor(None, EEW.from_dict, data)
+        self._alerts[eew.id] = eew
 
-        # call custom notification client
-        await asyncio.gather(*(c.send_eew(eew) for c in self._notification_client), return_exceptions=True)
+        self.logger.opt(lazy=True).info("{}", lambda: self._format_alert_log(eew))
 
-        return eew
+        eew.earthquake.calc_all_data_in_executor(self.__event_loop)
+
+        # the notification coroutines are gathered by the caller
+        return [c.send_eew(eew) for c in self._notification_client]
 
     async def update_alert(self, data: dict):
-        eew = EEW.from_dict(data)
+        eew = await self.__event_loop.run_in_executor(None, EEW.from_dict, data)
         old_eew = self._alerts.get(eew.id)
         self._alerts[eew.id] = eew
 
-        self.logger.info(
-            "EEW alert updated\n"
-            "--------------------------------\n"
-            f"       ID: {eew.id} (Serial {eew.serial})\n"
-            f" Location: {eew.earthquake.location.display_name}({eew.earthquake.lon:.2f}, {eew.earthquake.lat:.2f})\n"
-            f"Magnitude: {eew.earthquake.mag}\n"
-            f"    Depth: {eew.earthquake.depth}km\n"
-            f"     Time: {eew.earthquake.time.strftime('%Y/%m/%d %H:%M:%S')}\n"
-            "--------------------------------"
-        )
+        self.logger.opt(lazy=True).info("{}", lambda: self._format_alert_log(eew, updated=True))
 
         if old_eew is not None:
             old_eew.earthquake._calc_task.cancel()
         eew.earthquake.calc_all_data_in_executor(self.__event_loop)
 
-        # call custom notification client
-        await asyncio.gather(*(c.update_eew(eew) for c in self._notification_client), return_exceptions=True)
-
-        return eew
+        # the notification coroutines are gathered by the caller
+        return [c.update_eew(eew) for c in self._notification_client]
 
     async def lift_alert(self, eew: EEW):
-        # call custom notification client
-        await asyncio.gather(*(c.lift_eew(eew) for c in self._notification_client), return_exceptions=True)
+        # the notification coroutines are gathered by the caller
+        return [c.lift_eew(eew) for c in self._notification_client]
 
     def switch_api_node(self, type: str = "next"):
         """
@@ -111,47 +152,90 @@ class HTTPEEWClient(EEWClient):
             self.BASE_URL = random.choice(self.node_latencies)[0]
         else:
             raise ValueError(f"Invalid type: {type}")
+        self._URL = f"{self.BASE_URL}/eq/eew?type=cwa"
         self.logger.info(f"Switched to API node: {self.BASE_URL}")
 
     async def _get_request(self, retry: int = 0):
         try:
-            async with self.__session.get(f"{self.BASE_URL}/eq/eew?type=cwa") as r:
-                data: list[dict] = await r.json()
-                if not data:
-                    return
+            async with self.__session.get(self._URL) as r:
+                data: list[dict] = await r.json(loads=_json_loads, content_type=None)
+            self._consecutive_errors = 0
+            if not data:
+                return
         except Exception as e:
             if retry > 0:
                 self.recreate_session()
                 self.switch_api_node()
                 await asyncio.sleep(1)
                 return await self._get_request(retry - 1)
+            self._consecutive_errors += 1
             self.logger.exception("Fail to get eew data.", exc_info=e)
             return
 
-        _check_finished_alerts = set(self._alerts.keys())
-        for d in data:
-            id = d["id"]
-            _check_finished_alerts.discard(id)
+        preps = []
+        incoming = {d["id"]: d for d in data}
+        for id, d in incoming.items():
             cached_eew = self._alerts.get(id)
             if cached_eew is None:
-                await self.new_alert(d)
+                preps.append((id, self.new_alert(d)))
             elif d["serial"] > cached_eew.serial:
-                await self.update_alert(d)
+                preps.append((id, self.update_alert(d)))
 
         # remove finished alerts
-        for id in _check_finished_alerts:
-            cached_eew = self._alerts.pop(id, None)
-            if cached_eew is not None:
-                await self.lift_alert(cached_eew)
+        for id in self._alerts.keys() - incoming.keys():
+            preps.append((id, self.lift_alert(self._alerts.pop(id))))
+
+        if not preps:
+            return
+
+        results = await asyncio.gather(*(coro for _, coro in preps), return_exceptions=True)
+        for (id, _), result in zip(preps, results):
+            if isinstance(result, Exception):
+                self.logger.exception("Failed to process the eew alert.", exc_info=result)
+            elif result:
+                self._dispatch_notification(id, result)
+
+    def _dispatch_notification(self, id: str, coros: list) -> None:
+        """
+        Run an alert's notification fanout as its own task so a slow send does
+        not delay the poll cadence, chained behind the previous fanout for the
+        same alert so per-alert ordering (send -> update -> lift) is preserved.
+        """
+        prev_task = self._notify_tasks.get(id)
+
+        async def fanout():
+            if prev_task is not None:
+                await asyncio.wait((prev_task,))
+            await asyncio.gather(*coros, return_exceptions=True)
+
+        task = self.__event_loop.create_task(fanout())
+        self._notify_tasks[id] = task
+
+        def _cleanup(t: asyncio.Task):
+            if self._notify_tasks.get(id) is t:
+                del self._notify_tasks[id]
+
+        task.add_done_callback(_cleanup)
 
     async def _loop(self):
         self.__event_loop = asyncio.get_event_loop()
         self.logger.info("EEW Client is ready.")
         while True:
-            if not self.__task or self.__task.done():
-                self.__task = self.__event_loop.create_task(self._get_request(3))
+            # each attempt is already bounded by the session's ClientTimeout,
+            # so the retry/failover chain inside _get_request can run to completion
+            await self._get_request(3)
+            await asyncio.sleep(self._poll_interval())
 
-            await asyncio.sleep(0.5)
+    def _poll_interval(self) -> float:
+        """
+        The interval until the next poll: shorter while an alert is active,
+        exponentially backed off on consecutive request failures.
+        """
+        if self._consecutive_errors > 0:
+            return min(self._poll_interval_max, self._poll_interval_idle * 2**self._consecutive_errors)
+        if self._alerts:
+            return self._poll_interval_active
+        return self._poll_interval_idle
 
     async def start(self):
         """
@@ -166,6 +250,7 @@ class HTTPEEWClient(EEWClient):
         )
         self.node_latencies = sorted(latencies, key=lambda x: (x[1], x[0]))
         self.BASE_URL = self.node_latencies[0][0]
+        self._URL = f"{self.BASE_URL}/eq/eew?type=cwa"
         self.logger.debug(f"API node latencies: {self.node_latencies}")
         self.logger.info(f"Using fastest API node: {self.BASE_URL}")
         await self._loop()
@@ -183,4 +268,5 @@ class HTTPEEWClient(EEWClient):
         except KeyboardInterrupt:
             self.__event_loop.stop()
         finally:
+            self.__event_loop.run_until_complete(self.aclose())
             self.logger.info("EEW Client has been stopped.")
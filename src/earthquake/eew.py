@@ -36,6 +36,7 @@ class EarthquakeData:
         "_model",
         "_calc_task",
         "_city_max_intensity",
+        "_affected_cities",
         "_expected_intensity",
         "_p_arrival_distance_interp_func",
         "_s_arrival_distance_interp_func",
@@ -72,6 +73,7 @@ class EarthquakeData:
         self._model = get_wave_model(depth)
         self._calc_task: asyncio.Future = None
         self._city_max_intensity: dict[str, RegionExpectedIntensity] = None
+        self._affected_cities: tuple[tuple[str, RegionExpectedIntensity], ...] = None
         self._expected_intensity: dict[int, RegionExpectedIntensity] = None
         self._map: Map = Map(self)
 
@@ -145,6 +147,13 @@ class EarthquakeData:
         """
         return self._city_max_intensity
 
+    @property
+    def affected_cities(self) -> tuple[tuple[str, "RegionExpectedIntensity"], ...]:
+        """
+        The cities with a non-zero expected intensity (if have been calculated).
+        """
+        return self._affected_cities
+
     @property
     def map(self) -> Map:
         """
@@ -178,7 +187,7 @@ class EarthquakeData:
         """
         intensities = calculate_expected_intensity_and_travel_time(self, regions)
         self._expected_intensity = dict(intensities)
-        self._city_max_intensity = {
+        city_max_intensity = {
             city: max(city_intensities, key=lambda x: x.intensity._float_value)
             for city, regions in REGIONS_GROUP_BY_CITY.items()
             if (
@@ -189,6 +198,16 @@ class EarthquakeData:
                 ]
             )
         }
+        # the set of affected cities is fixed per report, so filter it once here
+        # instead of on every consumer iteration.
+        # consumers gate on city_max_intensity, so publish the filtered tuple
+        # first: this runs on an executor thread while the event loop reads
+        self._affected_cities = tuple(
+            (city, intensity)
+            for city, intensity in city_max_intensity.items()
+            if intensity.intensity.value > 0
+        )
+        self._city_max_intensity = city_max_intensity
         return self._expected_intensity
 
     def calc_all_data(self):
@@ -174,8 +174,12 @@ class Map:
         if not self._drawn:
             warnings.warn("Map have not been drawn yet, it will be empty.")
 
-        _map = io.BytesIO()
-        self.fig.savefig(_map, format="png", bbox_inches="tight")
-        _map.seek(0)
-        self._image = _map
+        # reuse the buffer across renders instead of allocating a new one per frame
+        if self._image is None:
+            self._image = io.BytesIO()
+        else:
+            self._image.seek(0)
+            self._image.truncate()
+        self.fig.savefig(self._image, format="png", bbox_inches="tight")
+        self._image.seek(0)
         return self._image
@@ -12,6 +12,15 @@ load_dotenv(override=True)
 
 
 def main():
+    # install the uvloop policy before any client grabs the event loop,
+    # so every component shares the same loop
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        uvloop = None
+
     config = Config()
     logger = Logging(
         retention=config["log"]["retention"],
@@ -23,6 +32,8 @@ def main():
         level=0 if config["debug-mode"] else logging.INFO,
         force=True,
     )
+    if uvloop is not None:
+        logger.debug("Using uvloop event loop.")
 
     key = os.getenv("API_KEY")
     if key:
@@ -1,14 +1,15 @@
 import asyncio
+import io
 import math
 import os
-from datetime import datetime
+import time
 from typing import Optional, TypedDict
 
 import discord
-from discord.ext import tasks
 
 from ..config import Config
 from ..earthquake.eew import EEW
+from ..earthquake.map import Map
 from ..logging import Logger
 from ..utils import MISSING
 from .base import NotificationClient
@@ -47,8 +48,9 @@ class EEWMessages:
         "_info_embed",
         "_intensity_embed",
         "_region_intensity",
+        "_row_prefixes",
         "map_url",
-        "_bot_latency",
+        "_last_row_hash",
         "_lift_time",
         "_last_update",
         "_map_update_interval",
@@ -72,8 +74,9 @@ class EEWMessages:
         self._info_embed: Optional[discord.Embed] = None
         self._intensity_embed = None
         self._region_intensity: Optional[dict[tuple[str, str], tuple[str, int]]] = None
+        self._row_prefixes: Optional[tuple[tuple[str, int], ...]] = None
         self.map_url: Optional[str] = None
-        self._bot_latency: float = 0
+        self._last_row_hash: Optional[int] = None
         self._lift_time = eew.earthquake.time.timestamp() + 120  # 2min
         self._last_update: float = 0
         self._map_update_interval: float = 1
@@ -97,32 +100,30 @@ class EEWMessages:
 
         return self._info_embed
 
-    def get_latency(self) -> float:
-        """
-        Get the bot latency.
-        """
-        if math.isfinite(ping := self.bot.latency):
-            self._bot_latency = ping
-        return self._bot_latency
-
-    def intensity_embed(self) -> discord.Embed:
+    def intensity_embed(self, current_time: Optional[int] = None) -> discord.Embed:
         if self.eew.earthquake.city_max_intensity is None:
             return self._intensity_embed
         if self._region_intensity is None:
             self.get_region_intensity()
 
-        current_time = int(datetime.now().timestamp() + self.get_latency())
-        self._intensity_embed = discord.Embed(
-            title="震度等級預估",
-            description="各縣市預估最大震度｜預計抵達時間\n"
+        if current_time is None:
+            current_time = int(time.time() + self.bot.get_latency())
+        if self._intensity_embed is None or not self._intensity_embed.colour:
+            # build the template once (the placeholder from `send` has no colour),
+            # afterwards only the description is rewritten per tick
+            self._intensity_embed = discord.Embed(
+                title="震度等級預估",
+                color=0xF39C12,
+                image="attachment://image.png",
+            ).set_footer(text="僅供參考，實際情況以氣象署公布之資料為準")
+        self._intensity_embed.description = (
+            "各縣市預估最大震度｜預計抵達時間\n"
             + "\n".join(
-                f"{city} {town} {intensity}｜{f'<t:{time}:R>抵達' if time > current_time else '⚠️已抵達'}"
-                for (city, town), (intensity, time) in self._region_intensity.items()
+                prefix + (f"<t:{time}:R>抵達" if time > current_time else "⚠️已抵達")
+                for prefix, time in self._row_prefixes
             )
-            + f"\n上次更新：<t:{current_time}:T> (<t:{current_time}:R>)",
-            color=0xF39C12,
-            image="attachment://image.png",
-        ).set_footer(text="僅供參考，實際情況以氣象署公布之資料為準")
+            + f"\n上次更新：<t:{current_time}:T> (<t:{current_time}:R>)"
+        )
 
         return self._intensity_embed
 
@@ -132,9 +133,13 @@ class EEWMessages:
                 intensity.intensity.display,
                 int(intensity.distance.s_arrival_time.timestamp()),
             )
-            for city, intensity in self.eew.earthquake.city_max_intensity.items()
-            if intensity.intensity.value > 0
+            for city, intensity in self.eew.earthquake.affected_cities
         }
+        # the per-row static part never changes between ticks, only the arrival suffix does
+        self._row_prefixes = tuple(
+            (f"{city} {town} {intensity}｜", time)
+            for (city, town), (intensity, time) in self._region_intensity.items()
+        )
         # self._lift_time = max(x[1] for x in self._region_intensity.values()) + 10
 
         return self._region_intensity
@@ -152,9 +157,25 @@ class EEWMessages:
             self.bot.logger.exception(f"Failed to send message in {channel.name}", exc_info=e)
             return None
 
+    @staticmethod
+    def _draw_map_frame(map: Map, travel_time: float):
+        """
+        Redraw the wave circles and render the map image.
+        This is CPU-bound (matplotlib) and should be run in an executor.
+
+        :param map: The (already drawn) map to render, captured by the caller
+            so an EEW update cannot swap it mid-render.
+        :type map: Map
+        :param travel_time: The travel time in seconds of the wave to draw.
+        :type travel_time: float
+        """
+        map.draw_wave(travel_time)
+        return map.save()
+
     async def _edit_singal_message(self, message: _SingleMessage, intensity_embed: discord.Embed, **kwargs):
         try:
-            return await message.edit(content=message.mention, embeds=[self._info_embed, intensity_embed], **kwargs)  # type: ignore
+            async with self.bot._edit_sem:
+                return await message.edit(content=message.mention, embeds=[self._info_embed, intensity_embed], **kwargs)  # type: ignore
         except Exception as e:
             self.bot.logger.exception(f"Failed to edit message {message.message.id}", exc_info=e)
             return None
@@ -179,14 +200,11 @@ class EEWMessages:
         :rtype: EEWMessage
         """
         self = cls(bot, eew, [])
-        self.messages = list(
-            filter(
-                None,
-                await asyncio.gather(
-                    *(self._send_singal_message(d["channel"], d["mention"]) for d in notification_channels)
-                ),
-            )
+        sent = await asyncio.gather(
+            *(self._send_singal_message(d["channel"], d["mention"]) for d in notification_channels),
+            return_exceptions=True,
         )
+        self.messages = [m for m in sent if isinstance(m, _SingleMessage)]
         if not self.messages:
             return None
 
@@ -194,42 +212,76 @@ class EEWMessages:
         self._intensity_embed = discord.Embed(title="震度等級預估", description="計算中...")
         return self
 
-    async def edit(self) -> None:
+    async def edit(self, current_time: Optional[float] = None, now_ts: Optional[int] = None) -> None:
         """
         Edit the discord messages to update S wave arrival time.
+
+        :param current_time: The current timestamp, computed once per tick by the caller.
+        :type current_time: Optional[float]
+        :param now_ts: The current timestamp with the bot latency added.
+        :type now_ts: Optional[int]
         """
-        intensity_embed = self.intensity_embed()
-        current_time = datetime.now().timestamp()
+        if current_time is None:
+            current_time = time.time()
+        if self._row_prefixes is not None and self.map_url:
+            check_time = now_ts if now_ts is not None else int(current_time)
+            arrivals = tuple(t > check_time for _, t in self._row_prefixes)
+            row_hash = hash((self.eew.serial, arrivals))
+            if row_hash == self._last_row_hash and not any(arrivals):
+                # every wave has arrived and the map is uploaded: nothing visible changes
+                return
+            self._last_row_hash = row_hash
+        intensity_embed = self.intensity_embed(now_ts)
         if not self.map_url or current_time - self._last_update >= self._map_update_interval:
             eq = self.eew.earthquake
             if not eq.map._drawn:
                 intensity_embed.remove_image()
                 file = {}
             else:
-                eq.map.draw_wave(current_time - eq.time.timestamp() + self.get_latency())
-                file = {"file": discord.File(eq.map.save(), "image.png")}
-
-            self._last_update = datetime.now().timestamp()
+                image = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    self._draw_map_frame,
+                    eq.map,
+                    current_time - eq.time.timestamp() + self.bot.get_latency(),
+                )
+                # give discord.File its own view so closing it can't touch the cached buffer
+                file = {"file": discord.File(io.BytesIO(image.getvalue()), "image.png")}
+                # the persistent embed was re-pointed at the CDN url (or cleared) on the
+                # previous tick, so reference the fresh attachment for this upload
+                intensity_embed.set_image(url="attachment://image.png")
+
+            self._last_update = time.time()
             self._map_update_interval = max(self._last_update - current_time, self._map_update_interval)
 
             m = await self._edit_singal_message(self.messages[0], intensity_embed, **file)
-            if len(m.embeds) > 1 and (image := m.embeds[1].image):
+            if m is None:
+                pass
+            elif len(m.embeds) > 1 and (image := m.embeds[1].image):
                 self.map_url = image.url
             elif self.eew.earthquake.map.image is not None:
                 # if intensity calc has done but map not drawn
                 self.bot.logger.warning("Failed to get image url.")
 
             update = ()
-            intensity_embed = self.intensity_embed()
         else:
-            update = (self._edit_singal_message(self.messages[0], intensity_embed.copy()),)
-        intensity_embed.set_image(url=self.map_url)
+            update = (self._edit_singal_message(self.messages[0], intensity_embed),)
+        # the CDN url works for every message, so the same embed object can be shared:
+        # discord.py serializes it per-request when the edit is awaited. drop the
+        # image entirely while no url is known - only the first message holds the
+        # attachment, so the other messages must not reference it
+        if self.map_url:
+            intensity_embed.set_image(url=self.map_url)
+        else:
+            intensity_embed.remove_image()
 
-        await asyncio.gather(
+        results = await asyncio.gather(
             *update,
             *(self._edit_singal_message(msg, intensity_embed) for msg in self.messages[1:]),
             return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, Exception):
+                self.bot.logger.exception("Failed to edit message", exc_info=result)
 
     async def update_eew_data(self, eew: EEW) -> "EEWMessages":
         """
@@ -240,6 +292,9 @@ class EEWMessages:
         """
         self.eew = eew
         self.map_url = None
+        self._region_intensity = None
+        self._row_prefixes = None
+        self._last_row_hash = None
         self.info_embed()
 
         return self
@@ -264,10 +319,6 @@ class DiscordNotification(NotificationClient, discord.Bot):
     Represents a discord notification client.
     """
 
-    # eew-id: EEWMessages
-    alerts: dict[str, EEWMessages] = {}
-    notification_channels: list[NotifyAndChannel] = []
-
     def __init__(self, logger: Logger, config: Config, token: str) -> None:
         """
         Initialize a new discord notification client.
@@ -283,14 +334,41 @@ class DiscordNotification(NotificationClient, discord.Bot):
         self.config = config
         self.token = token
 
+        # eew-id: EEWMessages
+        self.alerts: dict[str, EEWMessages] = {}
+        self.notification_channels: list[NotifyAndChannel] = []
+
         if not config.get("enable-log"):
             logger.disable("discord")  # avoid pycord shard info spamming the console
 
         self._client_ready = False
+        self._bot_latency: float = 0
+        # cap concurrent message edits to stay under Discord's per-route bucket
+        self._edit_sem = asyncio.Semaphore(5)
+        self._update_task: Optional[asyncio.Task] = None
+        self._tick_task: Optional[asyncio.Task] = None
+        self._tick_in_flight = False
         intents = discord.Intents.default()
         owner_ids = config.get("owners")
         super().__init__(owner_ids=owner_ids, intents=intents)
 
+        try:
+            import orjson
+
+            # pycord looks this up at call time, so the hot message-edit path
+            # serializes its payloads with orjson instead of the stdlib json
+            discord.utils._to_json = lambda obj: orjson.dumps(obj).decode("utf-8")
+        except ImportError:
+            pass
+
+    def get_latency(self) -> float:
+        """
+        Get the bot latency, falling back to the last finite value.
+        """
+        if math.isfinite(ping := self.latency):
+            self._bot_latency = ping
+        return self._bot_latency
+
     async def get_or_fetch_channel(self, id: int, default=MISSING):
         try:
             return self.get_channel(id) or await self.fetch_channel(id)
@@ -350,8 +428,8 @@ class DiscordNotification(NotificationClient, discord.Bot):
             return None
         self.alerts[eew.id] = m
 
-        if not self.update_eew_messages_loop.is_running():
-            self.update_eew_messages_loop.start()
+        if self._update_task is None or self._update_task.done():
+            self._update_task = self.loop.create_task(self.update_eew_messages_loop())
 
         return m
 
@@ -367,17 +445,40 @@ class DiscordNotification(NotificationClient, discord.Bot):
         if m is not None:
             await m.lift_eew()
 
-    @tasks.loop(seconds=1)
     async def update_eew_messages_loop(self):
-        if not self.alerts:
-            self.update_eew_messages_loop.stop()
-            return
-        now_time = int(datetime.now().timestamp())
-        for m in list(self.alerts.values()):
-            if now_time > m._lift_time:
-                await self.lift_eew(m.eew)
-            else:
-                await m.edit()
+        """
+        Drive the message updates on a fixed 1-second grid, so the time spent
+        editing does not accumulate into the tick period. Ticks that would
+        overlap a still-running one are skipped instead of delayed.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        while self.alerts:
+            tick += 1
+            await asyncio.sleep(max(0.0, start + tick - loop.time()))
+            if not self._tick_in_flight:
+                # keep a strong reference so the tick cannot be garbage-collected
+                # mid-flight, and surface any exception it raises
+                self._tick_task = loop.create_task(self._update_eew_messages())
+                self._tick_task.add_done_callback(self._on_tick_done)
+
+    def _on_tick_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and (e := task.exception()) is not None:
+            self.logger.exception("Failed to update EEW messages", exc_info=e)
+
+    async def _update_eew_messages(self):
+        self._tick_in_flight = True
+        try:
+            now_time = time.time()
+            now_ts = int(now_time + self.get_latency())
+            for m in list(self.alerts.values()):
+                if now_time > m._lift_time:
+                    await self.lift_eew(m.eew)
+                else:
+                    await m.edit(current_time=now_time, now_ts=now_ts)
+        finally:
+            self._tick_in_flight = False
 
 
 NAMESPACE = "discord-bot"
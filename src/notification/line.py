@@ -9,6 +9,8 @@ from ..logging import Logger
 from .base import NotificationClient
 
 LINE_API_NODE = "https://api.line.me/v2"
+MULTICAST_LIMIT = 500
+"The maximum number of recipients per multicast call"
 
 
 class LineNotification(NotificationClient):
@@ -16,9 +18,6 @@ class LineNotification(NotificationClient):
     Represents a linebot EEW notification client.
     """
 
-    alerts: dict[str, str] = {}
-    notification_channels: list[str] = []
-
     def __init__(self, logger: Logger, config: Config, access_token: str, channel_secret: str) -> None:
         """
         Initialize a new linebot notification client.
@@ -36,6 +35,10 @@ class LineNotification(NotificationClient):
         self.config = config
         self.__access_token = access_token
         self.__channel_secret = channel_secret
+        self.__session: aiohttp.ClientSession = None
+        # eew-id: message
+        self.alerts: dict[str, str] = {}
+        self.notification_channels: list[str] = []
 
         for channel_id in self.config["channels"]:
             # TODO: check channel status
@@ -145,17 +148,48 @@ class LineNotification(NotificationClient):
             }
         ]
 
-    async def _send_message(self, session: aiohttp.ClientSession, channel_id: str, message: dict) -> None:
+    async def aclose(self) -> None:
+        """
+        Close the client session.
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            self.__session = aiohttp.ClientSession(
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.__access_token}",
+                }
+            )
+        return self.__session
+
+    async def _send_multicast(
+        self, session: aiohttp.ClientSession, channel_ids: list[str], message: list[dict]
+    ) -> None:
         try:
             async with session.post(
-                f"{LINE_API_NODE}/bot/message/push", json={"to": channel_id, "messages": message}
+                f"{LINE_API_NODE}/bot/message/multicast", json={"to": channel_ids, "messages": message}
             ) as response:
                 if not response.ok:
                     raise aiohttp.ClientResponseError(
                         response.request_info, status=response.status, message=await response.text()
                     )
         except Exception as e:
-            self.logger.exception(f"Failed to send message alert to {channel_id}", exc_info=e)
+            self.logger.exception(
+                f"Failed to send message alert to {len(channel_ids)} channels", exc_info=e
+            )
+
+    async def _multicast_message(self, message: list[dict]) -> None:
+        session = self._ensure_session()
+        await asyncio.gather(
+            *(
+                self._send_multicast(session, self.notification_channels[i : i + MULTICAST_LIMIT], message)
+                for i in range(0, len(self.notification_channels), MULTICAST_LIMIT)
+            ),
+            return_exceptions=True,
+        )
 
     async def send_eew(self, eew: EEW) -> None:
         """
@@ -170,12 +204,7 @@ class LineNotification(NotificationClient):
             self.logger.error("No LINE notification channels available")
             return
 
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.__access_token}"}
-        msg = self._flex_message(eew)
-        async with aiohttp.ClientSession(headers=headers) as session:
-            await asyncio.gather(
-                *(self._send_message(session, channel_id, msg) for channel_id in self.notification_channels)
-            )
+        await self._multicast_message(self._flex_message(eew))
 
     async def update_eew(self, eew: EEW):
         """
@@ -190,12 +219,7 @@ class LineNotification(NotificationClient):
             self.logger.error("No LINE notification channels available")
             return
 
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.__access_token}"}
-        msg = self._flex_message(eew)
-        async with aiohttp.ClientSession(headers=headers) as session:
-            await asyncio.gather(
-                *(self._send_message(session, channel_id, msg) for channel_id in self.notification_channels)
-            )
+        await self._multicast_message(self._flex_message(eew))
 
     async def lift_eew(self, eew: EEW):
         """